@@ -3,22 +3,36 @@ Health check API routes for Bitsacco WhatsApp Bot
 Provides system health and status endpoints
 """
 
+import asyncio
+import time
 from fastapi import APIRouter
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import psutil
 
 from ...config import settings
 
 health_router = APIRouter(tags=["Health"])
 
+# (epoch second, ISO string) - probes hit these endpoints every second or two
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+
+def _current_timestamp() -> str:
+    """UTC ISO timestamp, formatted at most once per second"""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, datetime.utcfromtimestamp(now).isoformat())
+    return _timestamp_cache[1]
+
 
 @health_router.get("/health")
 async def health_check() -> Dict[str, Any]:
     """Basic health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _current_timestamp(),
         "service": settings.APP_NAME,
         "version": settings.VERSION,
         "services": {
@@ -34,14 +48,15 @@ async def health_check() -> Dict[str, Any]:
 async def detailed_health_check() -> Dict[str, Any]:
     """Detailed health check with system metrics"""
     try:
-        # Basic system metrics
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Basic system metrics - CPU sampling blocks for a second, so
+        # keep it off the event loop
+        cpu_percent = await asyncio.to_thread(psutil.cpu_percent, interval=1)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage("/")
 
         return {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _current_timestamp(),
             "service": settings.APP_NAME,
             "version": settings.VERSION,
             "system": {
@@ -67,7 +82,7 @@ async def detailed_health_check() -> Dict[str, Any]:
     except (psutil.Error, AttributeError, ValueError) as e:
         return {
             "status": "degraded",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _current_timestamp(),
             "error": str(e),
         }
 
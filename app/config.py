@@ -30,10 +30,14 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Outbound HTTP - cap on concurrent requests across all API clients
+    OUTBOUND_CONCURRENCY: int = 32
+
     # Bitsacco API
     BITSACCO_API_URL: str = "https://api.bitsacco.com"
     BITSACCO_API_KEY: str = "dev-api-key-change-in-production"
     BITSACCO_TIMEOUT: int = 30
+    BITSACCO_RATE_LIMIT_RPM: int = 600
 
     # WhatsApp
     WHATSAPP_SESSION_NAME: str = "bitsacco-session"
@@ -50,6 +54,7 @@ class Settings(BaseSettings):
     COINGECKO_API_KEY: Optional[str] = None
     BITCOIN_PRICE_UPDATE_INTERVAL: int = 60
     BITCOIN_PRICE_CACHE_TTL: int = 300
+    COINGECKO_RATE_LIMIT_RPM: int = 30
 
     # Logging
     LOG_LEVEL: str = "INFO"
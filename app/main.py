@@ -8,9 +8,12 @@ Date: July 2025
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from contextlib import asynccontextmanager
+import asyncio
+import orjson
 import uvicorn
 import structlog
 from typing import Dict, Any
@@ -37,6 +40,17 @@ logger = structlog.get_logger(__name__)
 # Global service instances
 services: Dict[str, Any] = {}
 
+# The root payload never changes, so serialize it once
+_ROOT_JSON = orjson.dumps(
+    {
+        "name": "Bitsacco WhatsApp Bot",
+        "version": "3.0.0",
+        "description": "Bitcoin SACCO WhatsApp integration",
+        "status": "operational",
+        "architecture": "Python-only production implementation",
+    }
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -85,7 +99,8 @@ async def lifespan(app: FastAPI):
     # Stop services gracefully
     if "whatsapp" in services:
         await services["whatsapp"].stop()
-    # Note: SimpleBitcoinPriceService doesn't need cleanup
+    if "bitcoin_price" in services:
+        await services["bitcoin_price"].close()
     if "bitsacco_api" in services:
         await services["bitsacco_api"].close()
     if "database" in services:
@@ -104,6 +119,7 @@ def create_app() -> FastAPI:
         docs_url="/docs" if settings.DEBUG else None,
         redoc_url="/redoc" if settings.DEBUG else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Security middleware
@@ -129,15 +145,9 @@ def create_app() -> FastAPI:
     app.include_router(api_router, prefix="/api", tags=["API"])
 
     @app.get("/")
-    async def root():
+    async def root() -> Response:
         """Root endpoint with bot information"""
-        return {
-            "name": "Bitsacco WhatsApp Bot",
-            "version": "3.0.0",
-            "description": "Bitcoin SACCO WhatsApp integration",
-            "status": "operational",
-            "architecture": "Python-only production implementation",
-        }
+        return Response(content=_ROOT_JSON, media_type="application/json")
 
     @app.get("/status")
     async def status():
@@ -147,16 +157,26 @@ def create_app() -> FastAPI:
             "services": {},
         }
 
-        for service_name, service in services.items():
-            try:
-                if hasattr(service, "health_check"):
-                    status_info["services"][service_name] = (
-                        await service.health_check()
-                    )
-                else:
-                    status_info["services"][service_name] = "running"
-            except Exception as e:
-                status_info["services"][service_name] = f"error: {str(e)}"
+        async def check(service: Any) -> Any:
+            if not hasattr(service, "health_check"):
+                return "running"
+            return await asyncio.wait_for(service.health_check(), timeout=2.0)
+
+        # Check all services concurrently so one slow upstream can't
+        # delay the whole report
+        service_names = list(services)
+        results = await asyncio.gather(
+            *(check(services[name]) for name in service_names),
+            return_exceptions=True,
+        )
+
+        for service_name, result in zip(service_names, results):
+            if isinstance(result, asyncio.TimeoutError):
+                status_info["services"][service_name] = "timeout"
+            elif isinstance(result, Exception):
+                status_info["services"][service_name] = f"error: {str(result)}"
+            else:
+                status_info["services"][service_name] = result
 
         return status_info
 
@@ -12,6 +12,38 @@ from ..models.user import MessageContext, UserSession
 
 logger = structlog.get_logger(__name__)
 
+# Greetings are fixed text, so they are built once rather than per message
+_WELCOME_BACK = """
+👋 Welcome back to Bitsacco, {name}!
+
+I'm your Bitcoin savings assistant. Here's what I can help you with:
+
+💰 *Check Bitcoin Prices*
+📊 *View Your Savings Balance*
+💸 *Start Bitcoin Savings*
+📈 *Track Your Investments*
+🔍 *Get Market Updates*
+
+Just type your request or ask me anything about Bitcoin!
+
+_Type 'help' for more options_
+""".strip()
+
+_WELCOME_NEW = """
+🌟 *Welcome to Bitsacco!*
+
+I'm your personal Bitcoin savings assistant. I'll help you:
+
+🚀 Start saving in Bitcoin easily
+📱 Track your investments
+💡 Learn about Bitcoin
+📊 Get real-time market updates
+
+To get started, I'll need to verify your phone number.
+
+_Reply with 'start' to begin your Bitcoin journey!_
+""".strip()
+
 
 class AIConversationService:
     """Production AI conversation service with context management"""
@@ -182,36 +214,11 @@ class AIConversationService:
         """Generate personalized welcome message"""
         try:
             if user_session.is_authenticated:
-                return f"""
-👋 Welcome back to Bitsacco, {user_session.first_name or 'friend'}!
-
-I'm your Bitcoin savings assistant. Here's what I can help you with:
-
-💰 *Check Bitcoin Prices*
-📊 *View Your Savings Balance*
-💸 *Start Bitcoin Savings*
-📈 *Track Your Investments*
-🔍 *Get Market Updates*
-
-Just type your request or ask me anything about Bitcoin!
-
-_Type 'help' for more options_
-                """.strip()
+                return _WELCOME_BACK.format(
+                    name=user_session.first_name or "friend"
+                )
             else:
-                return """
-🌟 *Welcome to Bitsacco!*
-
-I'm your personal Bitcoin savings assistant. I'll help you:
-
-🚀 Start saving in Bitcoin easily
-📱 Track your investments
-💡 Learn about Bitcoin
-📊 Get real-time market updates
-
-To get started, I'll need to verify your phone number.
-
-_Reply with 'start' to begin your Bitcoin journey!_
-                """.strip()
+                return _WELCOME_NEW
 
         except Exception as e:
             logger.error("Error generating welcome message", error=str(e))
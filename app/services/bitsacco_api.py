@@ -8,13 +8,28 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 import httpx
 from httpx import Timeout, Limits
+import orjson
 import structlog
 
 from ..config import settings
+from ..utils.rate_limit import (
+    OUTBOUND_REQUESTS,
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+)
+from ..utils.retry import (
+    IDEMPOTENT_METHODS,
+    RETRYABLE_STATUS_CODES,
+    backoff_delay,
+)
 
 logger = structlog.get_logger(__name__)
 
 
+class ResponseTooLargeError(Exception):
+    """Raised when an API response exceeds the configured size cap"""
+
+
 class BitsaccoAPIClient:
     """Production-ready Bitsacco API client with retry logic and caching"""
 
@@ -24,12 +39,22 @@ class BitsaccoAPIClient:
         self.client: Optional[httpx.AsyncClient] = None
 
         # Request configuration
-        self.timeout = Timeout(settings.BITSACCO_TIMEOUT)
-        self.limits = Limits(max_keepalive_connections=5, max_connections=10)
+        self.timeout = Timeout(settings.BITSACCO_TIMEOUT, connect=5.0)
+        self.max_response_bytes = 1_000_000
+        self.limits = Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=75.0,
+        )
 
         # Rate limiting and retry
         self.max_retries = 3
         self.retry_delay = 1.0
+        self.max_retry_delay = 32.0
+        self.rate_limiter = RateLimiter(settings.BITSACCO_RATE_LIMIT_RPM)
+        self.concurrency = AdaptiveConcurrencyLimiter(
+            initial=10, maximum=64, target_latency=2.0
+        )
 
         # Health status
         self.is_healthy = False
@@ -41,6 +66,7 @@ class BitsaccoAPIClient:
             self.client = httpx.AsyncClient(
                 timeout=self.timeout,
                 limits=self.limits,
+                http2=True,
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json",
@@ -347,6 +373,9 @@ class BitsaccoAPIClient:
             raise RuntimeError("API client not initialized")
 
         url = f"{self.base_url}{endpoint}"
+        # Encode once up front; the client already sends the JSON content type
+        content = orjson.dumps(json) if json is not None else None
+        idempotent = method.upper() in IDEMPOTENT_METHODS
 
         for attempt in range(self.max_retries + 1):
             try:
@@ -357,9 +386,31 @@ class BitsaccoAPIClient:
                     attempt=attempt + 1,
                 )
 
-                response = await self.client.request(
-                    method=method, url=url, json=json, params=params
-                )
+                await self.rate_limiter.wait_if_throttled()
+                async with self.concurrency.slot() as outcome:
+                    # Time only our own request, not the wait for the pool
+                    # shared with other upstreams
+                    async with OUTBOUND_REQUESTS:
+                        with outcome.timed():
+                            request = self.client.build_request(
+                                method=method,
+                                url=url,
+                                content=content,
+                                params=params,
+                            )
+                            # Stream so oversized bodies are rejected unbuffered
+                            response = await self.client.send(
+                                request, stream=True
+                            )
+                            try:
+                                body = await self._read_body(response)
+                            finally:
+                                await response.aclose()
+                    outcome.healthy = (
+                        response.status_code != 429
+                        and response.status_code < 500
+                    )
+                self.rate_limiter.update_from_headers(response.headers)
 
                 # Log response details
                 logger.debug(
@@ -369,12 +420,9 @@ class BitsaccoAPIClient:
                 )
 
                 # Handle different response codes
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 201:
-                    return response.json()
-                elif response.status_code == 204:
-                    return {}
+                if response.is_success:
+                    # Any 2xx means the request was applied - never resend it
+                    return orjson.loads(body) if body else {}
                 elif response.status_code == 404:
                     return None
                 elif response.status_code in [401, 403]:
@@ -387,49 +435,56 @@ class BitsaccoAPIClient:
                         request=response.request,
                         response=response,
                     )
-                elif response.status_code >= 500:
-                    # Server error - retry
-                    if attempt < self.max_retries:
-                        wait_time = self.retry_delay * (2**attempt)
-                        logger.warning(
-                            f"Server error, retrying in {wait_time}s",
-                            status_code=response.status_code,
-                            attempt=attempt + 1,
-                        )
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        response.raise_for_status()
-                else:
-                    # Client error - don't retry
-                    response.raise_for_status()
-
-            except httpx.TimeoutException:
-                if attempt < self.max_retries:
-                    wait_time = self.retry_delay * (2**attempt)
+                elif (
+                    response.status_code in RETRYABLE_STATUS_CODES
+                    # A 429 was rejected outright, so even writes are safe
+                    and (idempotent or response.status_code == 429)
+                    and attempt < self.max_retries
+                ):
+                    wait_time = backoff_delay(
+                        attempt, self.retry_delay, self.max_retry_delay
+                    )
                     logger.warning(
-                        f"Request timeout, retrying in {wait_time}s",
-                        endpoint=endpoint,
+                        f"Retryable status, retrying in {wait_time:.2f}s",
+                        status_code=response.status_code,
+                        retry_after=response.headers.get("retry-after"),
                         attempt=attempt + 1,
                     )
                     await asyncio.sleep(wait_time)
                     continue
                 else:
-                    logger.error("Request timeout after all retries", endpoint=endpoint)
-                    raise
+                    # Permanent error or out of retries; a status that
+                    # raise_for_status() accepts must not loop into a resend
+                    response.raise_for_status()
+                    raise httpx.HTTPStatusError(
+                        message=f"Unexpected status {response.status_code}",
+                        request=response.request,
+                        response=response,
+                    )
 
-            except httpx.NetworkError as e:
-                if attempt < self.max_retries:
-                    wait_time = self.retry_delay * (2**attempt)
+            except (httpx.TimeoutException, httpx.NetworkError) as e:
+                # Connection failures mean the request was never sent
+                never_sent = isinstance(
+                    e, (httpx.ConnectError, httpx.ConnectTimeout)
+                )
+                if (idempotent or never_sent) and attempt < self.max_retries:
+                    wait_time = backoff_delay(
+                        attempt, self.retry_delay, self.max_retry_delay
+                    )
                     logger.warning(
-                        f"Network error, retrying in {wait_time}s",
-                        error=str(e),
+                        f"Network error, retrying in {wait_time:.2f}s",
+                        error=str(e) or type(e).__name__,
+                        endpoint=endpoint,
                         attempt=attempt + 1,
                     )
                     await asyncio.sleep(wait_time)
                     continue
                 else:
-                    logger.error("Network error after all retries", error=str(e))
+                    logger.error(
+                        "Network error after all retries",
+                        error=str(e) or type(e).__name__,
+                        endpoint=endpoint,
+                    )
                     raise
 
             except Exception as e:
@@ -442,6 +497,27 @@ class BitsaccoAPIClient:
 
         return None
 
+    async def _read_body(self, response: httpx.Response) -> bytes:
+        """Read a streamed response body, enforcing max_response_bytes"""
+        declared = response.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > self.max_response_bytes:
+            raise ResponseTooLargeError(
+                f"Response of {declared} bytes exceeds "
+                f"{self.max_response_bytes} byte limit"
+            )
+
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes(64 * 1024):
+            size += len(chunk)
+            if size > self.max_response_bytes:
+                raise ResponseTooLargeError(
+                    f"Response exceeds {self.max_response_bytes} byte limit"
+                )
+            chunks.append(chunk)
+
+        return b"".join(chunks)
+
     async def close(self) -> None:
         """Close HTTP client"""
         if self.client:
@@ -3,36 +3,147 @@ Simplified Bitcoin Price Service - Professional Minimal Implementation
 Single API call with basic error handling
 """
 
+import asyncio
+import time
+from functools import lru_cache
 import httpx
-from typing import Optional
+import orjson
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import settings
+from ..utils.rate_limit import OUTBOUND_REQUESTS, RateLimiter
+from ..utils.retry import RETRYABLE_STATUS_CODES, backoff_delay
+
+
+@lru_cache(maxsize=64)
+def _format_price(price: float, currency: str) -> str:
+    """Render a price line; cached prices repeat until the cache refreshes"""
+    return f"₿ Bitcoin: ${price:,.2f} {currency.upper()}"
 
 
 class SimpleBitcoinPriceService:
     """Minimal Bitcoin price service for basic needs"""
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.api_url = "https://api.coingecko.com/api/v3/simple/price"
         self.timeout = 10.0
+        self.max_retries = 2
+        self.retry_delay = 0.5
+        # Longest upstream throttle worth waiting out before failing fast
+        self.max_throttle_wait = 1.0
+
+        # Request pieces are constant per currency, so build them once
+        self._price_headers: Dict[str, str] = (
+            {"x-cg-demo-api-key": settings.COINGECKO_API_KEY}
+            if settings.COINGECKO_API_KEY
+            else {}
+        )
+        self._price_params: Dict[str, Dict[str, str]] = {}
+
+        # Reuse one client so connections to CoinGecko stay warm; an
+        # injected client is owned (and closed) by the caller
+        self._client = client
+        self._owns_client = client is None
+
+        # Last good price per currency, stamped with time.monotonic()
+        self.cache_ttl = settings.BITCOIN_PRICE_CACHE_TTL
+        self._price_cache: Dict[str, Tuple[float, float]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.rate_limiter = RateLimiter(settings.COINGECKO_RATE_LIMIT_RPM)
 
     async def get_current_price(self, currency: str = "usd") -> Optional[float]:
         """Get current Bitcoin price - simple and reliable"""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    self.api_url, params={"ids": "bitcoin", "vs_currencies": currency}
-                )
+        cached = self._price_cache.get(currency)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        # Concurrent cache misses share a single upstream request
+        task = self._inflight.get(currency)
+        if task is None:
+            task = asyncio.create_task(self._fetch_price(currency))
+            self._inflight[currency] = task
+            task.add_done_callback(lambda _: self._inflight.pop(currency, None))
+
+        return await asyncio.shield(task)
+
+    async def _fetch_price(self, currency: str) -> Optional[float]:
+        """Fetch the price from CoinGecko and refresh the cache"""
+        params = self._price_params.get(currency)
+        if params is None:
+            params = {"ids": "bitcoin", "vs_currencies": currency}
+            self._price_params[currency] = params
+
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter.blocked_for() > self.max_throttle_wait:
+                # Throttled upstream: serve the last known price, if any
+                cached = self._price_cache.get(currency)
+                return cached[1] if cached else None
+            if attempt:
+                await asyncio.sleep(backoff_delay(attempt - 1, self.retry_delay))
+
+            try:
+                await self.rate_limiter.wait_if_throttled()
+                async with OUTBOUND_REQUESTS:
+                    response = await self._get_client().get(
+                        self.api_url, params=params, headers=self._price_headers
+                    )
+                self.rate_limiter.update_from_headers(response.headers)
                 if response.status_code == 200:
-                    data = response.json()
-                    return data.get("bitcoin", {}).get(currency)
-                return None
-        except Exception:
-            return None  # Fail silently, handle in calling code
+                    data = orjson.loads(response.content)
+                    price = data.get("bitcoin", {}).get(currency)
+                    if price is not None:
+                        self._price_cache[currency] = (time.monotonic(), price)
+                    return price
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return None
+            except httpx.TransportError:
+                pass  # Transient network failure - retry below
+            except Exception:
+                return None  # Fail silently, handle in calling code
+
+        return None
 
     def format_price(self, price: Optional[float], currency: str = "USD") -> str:
         """Format price for display"""
         if price is None:
             return "Price unavailable"
-        return f"₿ Bitcoin: ${price:,.2f} {currency.upper()}"
+        return _format_price(price, currency)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Health check for monitoring - a fresh cached price needs no request"""
+        now = time.monotonic()
+        fresh = any(
+            now - fetched_at < self.cache_ttl
+            for fetched_at, _ in self._price_cache.values()
+        )
+        if not fresh:
+            # A successful price fetch is the health signal (and warms the cache)
+            fresh = await self.get_current_price("usd") is not None
+
+        return {
+            "status": "healthy" if fresh else "unhealthy",
+            "cached_currencies": len(self._price_cache),
+        }
+
+    async def close(self) -> None:
+        """Close the HTTP client if this service created it"""
+        if self._client and self._owns_client:
+            await self._client.aclose()
+        self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=75.0,
+                ),
+            )
+            self._owns_client = True
+        return self._client
 
 
 # Usage in your bot:
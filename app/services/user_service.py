@@ -3,6 +3,8 @@ User Service - User management and authentication
 Handles user sessions, authentication, and state management
 """
 
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Any
 from datetime import datetime, timedelta
 import structlog
@@ -13,17 +15,45 @@ from ..services.bitsacco_api import BitsaccoAPIClient
 logger = structlog.get_logger(__name__)
 
 
+# Deletes every ASCII non-digit in one C-level pass
+_NON_DIGITS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
+
+
+@lru_cache(maxsize=512)
+def normalize_phone_number(phone_number: str) -> str:
+    """Clean and normalize phone number (cached, users message repeatedly)"""
+    # Remove all non-digit characters
+    if phone_number.isascii():
+        digits_only = phone_number.translate(_NON_DIGITS)
+    else:
+        digits_only = "".join(filter(str.isdigit, phone_number))
+
+    # Handle Kenyan numbers
+    if digits_only.startswith("254"):
+        return f"+{digits_only}"
+    elif len(digits_only) == 10 and digits_only[0] == "0":
+        return f"+254{digits_only[1:]}"
+    elif len(digits_only) == 9:
+        return f"+254{digits_only}"
+    else:
+        return f"+{digits_only}"
+
+
 class UserService:
     """Production user service with session management"""
 
     def __init__(self, bitsacco_api: BitsaccoAPIClient):
         self.bitsacco_api = bitsacco_api
-        self.user_sessions: Dict[str, UserSession] = {}
+        # Ordered by recency so the least recently active session is evicted
+        self.user_sessions: OrderedDict[str, UserSession] = OrderedDict()
         self.is_running = False
 
         # Session settings
         self.session_timeout = timedelta(hours=24)
         self.otp_timeout = timedelta(minutes=5)
+        self.max_sessions = 10_000
 
     async def start(self) -> None:
         """Start the user service"""
@@ -52,6 +82,7 @@ class UserService:
 
             # Check if session is expired
             if not self._is_session_expired(session):
+                self.user_sessions.move_to_end(phone_number)
                 return session
             else:
                 # Remove expired session
@@ -66,7 +97,7 @@ class UserService:
             last_activity=datetime.utcnow(),
         )
 
-        self.user_sessions[phone_number] = session
+        self._store_session(phone_number, session)
 
         logger.debug("Created new user session", user=phone_number)
         return session
@@ -75,7 +106,7 @@ class UserService:
         """Update user session"""
         session.last_activity = datetime.utcnow()
         if session.phone_number:
-            self.user_sessions[session.phone_number] = session
+            self._store_session(session.phone_number, session)
 
         logger.debug(
             "Updated user session",
@@ -291,18 +322,16 @@ _Keep your account secure and never share your verification codes!_
 
     def _clean_phone_number(self, phone_number: str) -> str:
         """Clean and normalize phone number"""
-        # Remove all non-digit characters
-        digits_only = "".join(filter(str.isdigit, phone_number))
+        return normalize_phone_number(phone_number)
+
+    def _store_session(self, phone_number: str, session: UserSession) -> None:
+        """Store session as most recent, evicting the oldest beyond the cap"""
+        self.user_sessions[phone_number] = session
+        self.user_sessions.move_to_end(phone_number)
 
-        # Handle Kenyan numbers
-        if digits_only.startswith("254"):
-            return f"+{digits_only}"
-        elif digits_only.startswith("0") and len(digits_only) == 10:
-            return f"+254{digits_only[1:]}"
-        elif len(digits_only) == 9:
-            return f"+254{digits_only}"
-        else:
-            return f"+{digits_only}"
+        while len(self.user_sessions) > self.max_sessions:
+            evicted, _ = self.user_sessions.popitem(last=False)
+            logger.debug("Evicted least recently used session", user=evicted)
 
     def _is_session_expired(self, session: UserSession) -> bool:
         """Check if session is expired"""
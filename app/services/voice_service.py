@@ -3,8 +3,9 @@ ElevenLabs Voice Service for Bitsacco WhatsApp Bot
 Handles voice synthesis using ElevenLabs API
 """
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
 try:
@@ -28,6 +29,7 @@ class ElevenLabsVoiceService:
         self.is_initialized: bool = False
         self.is_running: bool = False
         self.available_voices: Dict[str, Any] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
         self.logger = logging.getLogger(__name__)
 
     async def start(self) -> None:
@@ -68,7 +70,8 @@ class ElevenLabsVoiceService:
     async def _load_voices(self) -> None:
         """Load available voices from ElevenLabs API"""
         try:
-            voices_list = voices()
+            # The SDK call is a blocking HTTP request; keep it off the loop
+            voices_list = await asyncio.to_thread(voices)
             self.available_voices = {
                 voice.voice_id: {
                     "name": voice.name,
@@ -103,12 +106,25 @@ class ElevenLabsVoiceService:
             return None
 
         voice_to_use = voice_id or self.voice_id
-        
+
+        # Concurrent callers asking for the same audio share one API call
+        key = (text, voice_to_use)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._generate_audio(text, voice_to_use))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _generate_audio(self, text: str, voice_id: str) -> Optional[bytes]:
+        """Call the ElevenLabs API for a single text/voice pair"""
         try:
             # Generate audio
-            audio = generate(
+            audio = await asyncio.to_thread(
+                generate,
                 text=text,
-                voice=voice_to_use,
+                voice=voice_id,
                 model="eleven_monolingual_v1"
             )
             
@@ -119,6 +135,34 @@ class ElevenLabsVoiceService:
             self.logger.error(f"Failed to synthesize speech: {e}")
             return None
 
+    async def synthesize_many(
+        self, requests: List[Dict[str, Any]]
+    ) -> List[Optional[bytes]]:
+        """
+        Synthesize a batch of texts, calling the API once per unique input
+
+        Args:
+            requests: Dicts with a "text" key and an optional "voice_id"
+
+        Returns:
+            Audio data (or None) for each request, in the original order
+        """
+        keys = [
+            (request["text"], request.get("voice_id") or self.voice_id)
+            for request in requests
+        ]
+        unique_keys = list(dict.fromkeys(keys))
+
+        results = await asyncio.gather(
+            *(self.synthesize_speech(text, voice) for text, voice in unique_keys)
+        )
+        audio_by_key = dict(zip(unique_keys, results))
+
+        self.logger.info(
+            f"Synthesized {len(requests)} requests with {len(unique_keys)} API calls"
+        )
+        return [audio_by_key[key] for key in keys]
+
     async def save_speech_to_file(self, text: str, file_path: str, voice_id: Optional[str] = None) -> bool:
         """
         Synthesize speech and save to file
@@ -136,11 +180,8 @@ class ElevenLabsVoiceService:
             return False
 
         try:
-            # Ensure directory exists
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save audio to file
-            save(audio_data, file_path)
+            # Directory creation and the write are blocking file I/O
+            await asyncio.to_thread(self._write_audio_file, audio_data, file_path)
             self.logger.info(f"Speech saved to {file_path}")
             return True
             
@@ -148,6 +189,12 @@ class ElevenLabsVoiceService:
             self.logger.error(f"Failed to save speech to file: {e}")
             return False
 
+    @staticmethod
+    def _write_audio_file(audio_data: bytes, file_path: str) -> None:
+        """Ensure the target directory exists and save audio to it"""
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        save(audio_data, file_path)
+
     async def get_available_voices(self) -> Dict[str, Any]:
         """Get list of available voices"""
         if not self.is_initialized:
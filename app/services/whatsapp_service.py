@@ -30,11 +30,14 @@ from ..models.user import (
 )
 from .bitsacco_api import BitsaccoAPIClient
 from .ai_service import AIConversationService
-from .user_service import UserService
+from .user_service import UserService, normalize_phone_number
 from .simple_bitcoin_service import SimpleBitcoinPriceService
 
 logger = structlog.get_logger(__name__)
 
+# Approximate USD to KES rate used to value Bitcoin balances
+KES_PER_USD = 130
+
 
 class MessageType(Enum):
     TEXT = "text"
@@ -620,22 +623,20 @@ What would you like to do?
                 )
                 return
 
-            balance_data = await self.bitsacco_api.get_balance(
-                session.bitsacco_user_id
+            # Balance and price are independent - fetch them concurrently
+            balance_data, btc_price_usd = await asyncio.gather(
+                self.bitsacco_api.get_balance(session.bitsacco_user_id),
+                self.bitcoin_service.get_current_price("usd"),
             )
 
             if balance_data.get("success"):
                 btc_balance = balance_data.get("btc_balance", 0)
                 kes_balance = balance_data.get("kes_balance", 0)
 
-                # Get current Bitcoin price
-                btc_price_usd = await self.bitcoin_service.get_current_price(
-                    "usd"
-                )
                 # Convert to KES (simplified - use fixed rate or
                 # implement conversion)
                 if btc_price_usd is not None:
-                    btc_price_kes = btc_price_usd * 130  # Approx USD to KES
+                    btc_price_kes = btc_price_usd * KES_PER_USD
                 else:
                     btc_price_kes = 0
                 btc_value_kes = (
@@ -905,18 +906,7 @@ Example: "How much Bitcoin do I have?" or "I want to save 500 shillings"
 
     def _normalize_phone_number(self, phone: str) -> str:
         """Normalize phone number to international format"""
-        # Remove all non-digits
-        digits = "".join(filter(str.isdigit, phone))
-
-        # Handle Kenyan numbers
-        if digits.startswith("254"):
-            return f"+{digits}"
-        elif digits.startswith("0") and len(digits) == 10:
-            return f"+254{digits[1:]}"
-        elif len(digits) == 9:
-            return f"+254{digits}"
-        else:
-            return f"+{digits}"
+        return normalize_phone_number(phone)
 
     def _is_valid_phone_number(self, phone: str) -> bool:
         """Validate phone number format"""
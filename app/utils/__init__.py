@@ -4,5 +4,12 @@ Common utilities and helper functions
 """
 
 from .logging import setup_logging
+from .rate_limit import AdaptiveConcurrencyLimiter, RateLimiter
+from .retry import backoff_delay
 
-__all__ = ["setup_logging"]
+__all__ = [
+    "setup_logging",
+    "AdaptiveConcurrencyLimiter",
+    "RateLimiter",
+    "backoff_delay",
+]
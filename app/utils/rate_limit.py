@@ -0,0 +1,174 @@
+"""
+Rate limiting helpers for outbound API calls
+Keeps the bot under upstream request quotas
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Iterator, Mapping, Optional
+
+import httpx
+
+from ..config import settings
+
+# Shared by every API client so bursts can't exhaust the connection pools
+OUTBOUND_REQUESTS = asyncio.Semaphore(settings.OUTBOUND_CONCURRENCY)
+
+
+class RateLimiter:
+    """Sliding-window request limiter that also honours upstream throttling"""
+
+    def __init__(self, rpm_limit: int, window: float = 60.0):
+        self.rpm_limit = rpm_limit
+        self.window = window
+        self._sent: Deque[float] = deque()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait_if_throttled(self) -> None:
+        """Wait until a request may be sent, then record it (proactive)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                while self._sent and now - self._sent[0] >= self.window:
+                    self._sent.popleft()
+
+                if len(self._sent) < self.rpm_limit:
+                    self._sent.append(now)
+                    return
+
+                await asyncio.sleep(self.window - (now - self._sent[0]))
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Pause outbound requests when the upstream asks us to (reactive)"""
+        delay = self._parse_seconds(headers.get("retry-after"))
+
+        if delay is None and headers.get("x-ratelimit-remaining") == "0":
+            delay = self._parse_seconds(headers.get("x-ratelimit-reset"))
+
+        if delay:
+            # Some APIs send an epoch or hours here; never wait past one window
+            delay = min(delay, self.window)
+            self._blocked_until = max(
+                self._blocked_until, time.monotonic() + delay
+            )
+
+    def blocked_for(self) -> float:
+        """Seconds until the upstream accepts requests again"""
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    @staticmethod
+    def _parse_seconds(value: Optional[str]) -> Optional[float]:
+        """Parse a header holding a number of seconds"""
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            return None
+
+
+@dataclass
+class RequestOutcome:
+    """Result of a request made inside an adaptive concurrency slot"""
+
+    healthy: bool = True
+    latency: Optional[float] = None
+
+    @contextmanager
+    def timed(self) -> Iterator[None]:
+        """Measure only the wrapped block, e.g. to exclude shared queueing"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.latency = time.monotonic() - started
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency cap: grow slowly while healthy, halve on trouble"""
+
+    def __init__(
+        self,
+        initial: int = 10,
+        minimum: int = 1,
+        maximum: int = 64,
+        target_latency: float = 2.0,
+        increase_every: int = 10,
+        latency_window: int = 20,
+        decrease_cooldown: Optional[float] = None,
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.increase_every = increase_every
+        # At most one decrease per cooldown, so a burst counts as one event
+        self.decrease_cooldown = (
+            target_latency if decrease_cooldown is None else decrease_cooldown
+        )
+        self._decreased_at = float("-inf")
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._healthy_streak = 0
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[RequestOutcome]:
+        """Hold a concurrency slot for one request and learn from its result"""
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self._in_flight < int(self.limit)
+            )
+            self._in_flight += 1
+
+        outcome = RequestOutcome()
+        started = time.monotonic()
+        try:
+            yield outcome
+        except httpx.TransportError:
+            # Only upstream trouble is congestion; our own errors (e.g. a
+            # rejected oversized body) say nothing about upstream capacity
+            outcome.healthy = False
+            raise
+        finally:
+            latency = outcome.latency
+            if latency is None:
+                latency = time.monotonic() - started
+            self._record(latency, outcome.healthy, started)
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _record(self, latency: float, healthy: bool, started: float) -> None:
+        """Additive increase on healthy latency, multiplicative decrease else"""
+        self._latencies.append(latency)
+        average = sum(self._latencies) / len(self._latencies)
+
+        if not healthy or average > self.target_latency:
+            self._healthy_streak = 0
+            now = time.monotonic()
+            # Requests admitted before the last decrease report the same
+            # congestion event; they must not shrink the limit again
+            if (
+                started >= self._decreased_at
+                and now - self._decreased_at >= self.decrease_cooldown
+            ):
+                self.limit = max(self.minimum, self.limit * 0.5)
+                self._decreased_at = now
+                # Start the next average from fresh samples
+                self._latencies.clear()
+            return
+
+        self._healthy_streak += 1
+        if self._healthy_streak >= self.increase_every:
+            self.limit = min(self.maximum, self.limit + 1)
+            self._healthy_streak = 0
@@ -0,0 +1,18 @@
+"""
+Retry helpers for outbound API calls
+Exponential back-off with jitter for transient failures
+"""
+
+import random
+
+# Statuses worth retrying - the upstream may succeed on a later attempt
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Methods that can be repeated without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 32.0) -> float:
+    """Exponential back-off for a zero-based attempt, plus up to 25% jitter"""
+    delay = min(cap, base * (2**attempt))
+    return delay + random.uniform(0, 0.25 * delay)  # nosec B311 - jitter only
@@ -71,18 +71,26 @@ def run_dev_server():
     print("📖 API docs: http://localhost:8000/docs")
     print("")
 
+    import importlib.util
+
+    command = [
+        "uvicorn",
+        "app.main:app",
+        "--reload",
+        "--host",
+        "0.0.0.0",
+        "--port",
+        "8000",
+    ]
+
+    # Native event loop and HTTP parser; uvloop is unavailable on Windows
+    if importlib.util.find_spec("uvloop") is not None:
+        command += ["--loop", "uvloop"]
+    if importlib.util.find_spec("httptools") is not None:
+        command += ["--http", "httptools"]
+
     try:
-        subprocess.run(
-            [
-                "uvicorn",
-                "app.main:app",
-                "--reload",
-                "--host",
-                "0.0.0.0",
-                "--port",
-                "8000",
-            ]
-        )
+        subprocess.run(command)
     except KeyboardInterrupt:
         print("\n👋 Bot stopped")
 
@@ -90,7 +98,7 @@ def run_dev_server():
 def run_tests():
     """Run the test suite"""
     print("🧪 Running tests...")
-    subprocess.run(["pytest", "-v"])
+    subprocess.run(["pytest", "-v", "-n", "auto", "--dist", "loadfile"])
 
 
 def main():
@@ -10,9 +10,9 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
 )
+from sqlalchemy import event
 from sqlalchemy.pool import StaticPool
-from httpx import AsyncClient
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from tests.test_app_simple import create_test_app
 from app.database.models import Base
@@ -31,14 +31,24 @@ def event_loop():
 
 
 @pytest.fixture(scope="session")
-async def test_engine():
-    """Create test database engine"""
+async def test_engine(event_loop):
+    """Create test database engine (disposed before the loop closes)"""
     engine = create_async_engine(
         TEST_DATABASE_URL,
         poolclass=StaticPool,
         connect_args={"check_same_thread": False},
     )
 
+    # The sqlite driver defers BEGIN, which breaks SAVEPOINTs; take
+    # control of transactions so test_db can roll back per test
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     # Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -57,25 +67,28 @@ async def test_session_maker(test_engine):
 
 
 @pytest.fixture
-async def test_db(test_session_maker) -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session"""
-    async with test_session_maker() as session:
-        yield session
-        await session.rollback()
+async def test_db(
+    test_engine, test_session_maker
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create test database session isolated by an outer transaction"""
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
 
+        # Session commits only release a SAVEPOINT; the outer rollback
+        # undoes everything without recreating the schema
+        async with test_session_maker(
+            bind=conn, join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
 
-@pytest.fixture
-def test_client():
-    """Create test client"""
-    app = create_test_app()
-    return TestClient(app)
+        await trans.rollback()
 
 
 @pytest.fixture
 async def async_client():
-    """Create async test client"""
-    app = create_test_app()
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    """Create async test client talking to the app in-process"""
+    transport = ASGITransport(app=create_test_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
 
@@ -2,17 +2,15 @@
 API Tests - Test FastAPI routes and endpoints
 """
 
-import pytest
 from httpx import AsyncClient
-from fastapi.testclient import TestClient
 
 
 class TestHealthEndpoints:
     """Test health check endpoints"""
 
-    def test_health_check(self, test_client: TestClient):
+    async def test_health_check(self, async_client: AsyncClient):
         """Test basic health check"""
-        response = test_client.get("/health")
+        response = await async_client.get("/health")
         assert response.status_code == 200
 
         data = response.json()
@@ -20,9 +18,9 @@ class TestHealthEndpoints:
         assert "timestamp" in data
         assert "services" in data
 
-    def test_detailed_health_check(self, test_client: TestClient):
+    async def test_detailed_health_check(self, async_client: AsyncClient):
         """Test detailed health check"""
-        response = test_client.get("/health/detailed")
+        response = await async_client.get("/health/detailed")
         assert response.status_code == 200
 
         data = response.json()
@@ -34,7 +32,7 @@ class TestHealthEndpoints:
 class TestWhatsAppWebhook:
     """Test WhatsApp webhook endpoints"""
 
-    def test_webhook_verification(self, test_client: TestClient):
+    async def test_webhook_verification(self, async_client: AsyncClient):
         """Test webhook verification"""
         params = {
             "hub.mode": "subscribe",
@@ -42,11 +40,13 @@ class TestWhatsAppWebhook:
             "hub.verify_token": "your_verify_token",
         }
 
-        response = test_client.get("/webhook/whatsapp", params=params)
+        response = await async_client.get("/webhook/whatsapp", params=params)
         assert response.status_code == 200
         assert response.text == '"test_challenge"'
 
-    def test_webhook_verification_invalid_token(self, test_client: TestClient):
+    async def test_webhook_verification_invalid_token(
+        self, async_client: AsyncClient
+    ):
         """Test webhook verification with invalid token"""
         params = {
             "hub.mode": "subscribe",
@@ -54,14 +54,14 @@ class TestWhatsAppWebhook:
             "hub.verify_token": "invalid_token",
         }
 
-        response = test_client.get("/webhook/whatsapp", params=params)
+        response = await async_client.get("/webhook/whatsapp", params=params)
         assert response.status_code == 403
 
-    def test_webhook_message(
-        self, test_client: TestClient, mock_whatsapp_message
+    async def test_webhook_message(
+        self, async_client: AsyncClient, mock_whatsapp_message
     ):
         """Test incoming webhook message"""
-        response = test_client.post(
+        response = await async_client.post(
             "/webhook/whatsapp", json=mock_whatsapp_message
         )
         assert response.status_code == 200
@@ -73,9 +73,9 @@ class TestWhatsAppWebhook:
 class TestBitcoinAPI:
     """Test Bitcoin price API"""
 
-    def test_get_bitcoin_price(self, test_client: TestClient):
+    async def test_get_bitcoin_price(self, async_client: AsyncClient):
         """Test Bitcoin price endpoint"""
-        response = test_client.get("/bitcoin/price")
+        response = await async_client.get("/bitcoin/price")
         assert response.status_code == 200
 
         data = response.json()
@@ -88,9 +88,9 @@ class TestBitcoinAPI:
 class TestStatsAPI:
     """Test statistics API"""
 
-    def test_get_stats(self, test_client: TestClient):
+    async def test_get_stats(self, async_client: AsyncClient):
         """Test stats endpoint"""
-        response = test_client.get("/stats")
+        response = await async_client.get("/stats")
         assert response.status_code == 200
 
         data = response.json()
@@ -99,7 +99,6 @@ class TestStatsAPI:
         assert "messages_today" in data
 
 
-@pytest.mark.asyncio
 class TestAsyncEndpoints:
     """Test async endpoints"""
 
@@ -5,11 +5,21 @@ Simplified FastAPI app for testing - without lifespan complexity
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
 from app.config import settings
 
+_ROOT_JSON = orjson.dumps(
+    {
+        "name": "Bitsacco WhatsApp Bot",
+        "version": "3.0.0-test",
+        "status": "operational",
+    }
+)
+
 
 def create_test_app() -> FastAPI:
     """Create a simplified FastAPI app for testing"""
@@ -20,6 +30,7 @@ def create_test_app() -> FastAPI:
         version="3.0.0-test",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
     )
 
     # CORS middleware
@@ -66,13 +77,9 @@ def create_test_app() -> FastAPI:
         }
 
     @app.get("/")
-    async def root():
+    async def root() -> Response:
         """Root endpoint"""
-        return {
-            "name": "Bitsacco WhatsApp Bot",
-            "version": "3.0.0-test",
-            "status": "operational",
-        }
+        return Response(content=_ROOT_JSON, media_type="application/json")
 
     # Webhook endpoints
     @app.get("/webhook/whatsapp")
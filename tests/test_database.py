@@ -0,0 +1,28 @@
+"""
+Database Tests - Test per-test database isolation
+"""
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database.models import UserSessionModel
+
+
+class TestDatabaseIsolation:
+    """Test committed rows are rolled back between tests"""
+
+    @pytest.mark.parametrize("run", ["first", "second"])
+    async def test_committed_row_does_not_leak(self, test_db, run):
+        """Test each run starts empty even after the other one committed"""
+        count = await test_db.scalar(
+            select(func.count()).select_from(UserSessionModel)
+        )
+        assert count == 0
+
+        test_db.add(UserSessionModel(phone_number="+254700000000"))
+        await test_db.commit()
+
+        count = await test_db.scalar(
+            select(func.count()).select_from(UserSessionModel)
+        )
+        assert count == 1
@@ -22,7 +22,6 @@ class TestUserAuthenticationFlow:
 
         return {"bitsacco_api": bitsacco_api, "user_service": user_service}
 
-    @pytest.mark.asyncio
     async def test_complete_authentication_flow(self, mock_services):
         """Test full authentication from start to completion"""
         phone = "+254712345678"
@@ -61,7 +60,6 @@ class TestUserAuthenticationFlow:
 class TestBitcoinSavingsFlow:
     """Test Bitcoin savings transaction workflow"""
 
-    @pytest.mark.asyncio
     async def test_savings_initiation(self):
         """Test Bitcoin savings initiation"""
         # Implementation for savings flow testing
@@ -71,12 +69,10 @@ class TestBitcoinSavingsFlow:
 class TestErrorHandling:
     """Test error handling and recovery scenarios"""
 
-    @pytest.mark.asyncio
     async def test_api_timeout_handling(self):
         """Test handling of API timeouts"""
         pass
 
-    @pytest.mark.asyncio
     async def test_invalid_phone_number(self):
         """Test handling of invalid phone numbers"""
         pass
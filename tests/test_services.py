@@ -2,38 +2,119 @@
 Service Tests - Test core business logic services
 """
 
+import asyncio
+import dataclasses
+import time
+import httpx
+import orjson
 import pytest
+from contextlib import nullcontext
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
 
-from app.services.user_service import UserService
+from app.services.user_service import UserService, normalize_phone_number
+from app.services.bitsacco_api import BitsaccoAPIClient
 from app.services.ai_service import AIConversationService
 from app.services.simple_bitcoin_service import SimpleBitcoinPriceService
+from app.services import voice_service as voice_service_module
+from app.services.voice_service import ElevenLabsVoiceService
+from app.utils.rate_limit import AdaptiveConcurrencyLimiter, RateLimiter
 from app.models.user import UserSession, UserState, MessageContext, MessageType
 
+# Fixed clock for model timestamps so tests are deterministic
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+# Per-test wrappers call reset_mock(side_effect=True), keeping return values
+@pytest.fixture(scope="session")
+def shared_bitsacco_api():
+    """Mock Bitsacco API service, built once"""
+    mock = AsyncMock()
+    mock.get_user_by_phone.return_value = {
+        "first_name": "John",
+        "last_name": "Doe",
+        "created_at": "2024-01-01",
+    }
+    mock.send_otp.return_value = True
+    mock.verify_otp.return_value = True
+    return mock
+
+
+@pytest.fixture(scope="session")
+def shared_openai_client():
+    """Mock OpenAI client, built once"""
+    mock_response = SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                message=SimpleNamespace(content="Hello! How can I help you?")
+            )
+        ]
+    )
+    mock = AsyncMock()
+    mock.chat.completions.create = AsyncMock(return_value=mock_response)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def shared_http_client():
+    """Mock HTTP client, built once"""
+    mock = AsyncMock()
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps(
+        {
+            "bitcoin": {
+                "usd": 45000.0,
+                "kes": 6750000.0,
+                "usd_24h_change": 2.5,
+                "kes_24h_change": 2.5,
+            }
+        }
+    )
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.raise_for_status.return_value = None
+    mock.get.return_value = mock_response
+    return mock
+
+
+@pytest.fixture
+def base_session():
+    """Fresh canonical user session (mutable, so built per test)"""
+    return UserSession(
+        user_id="test_user_id",
+        phone_number="+254700000000",
+        current_state=UserState.INITIAL,
+        created_at=FROZEN_NOW,
+        last_activity=FROZEN_NOW,
+    )
+
+
+@pytest.fixture
+def base_message():
+    """Fresh canonical text message (mutable, so built per test)"""
+    return MessageContext(
+        user_id="test_user_id",
+        original_message="Hello",
+        message_type=MessageType.TEXT,
+        timestamp=FROZEN_NOW,
+    )
+
 
 class TestUserService:
     """Test user service functionality"""
 
     @pytest.fixture
-    def mock_bitsacco_api(self):
+    def mock_bitsacco_api(self, shared_bitsacco_api):
         """Mock Bitsacco API service"""
-        mock = AsyncMock()
-        mock.get_user_by_phone.return_value = {
-            "first_name": "John",
-            "last_name": "Doe",
-            "created_at": "2024-01-01",
-        }
-        mock.send_otp.return_value = True
-        mock.verify_otp.return_value = True
-        return mock
+        shared_bitsacco_api.reset_mock(side_effect=True)
+        return shared_bitsacco_api
 
     @pytest.fixture
     def user_service(self, mock_bitsacco_api):
         """User service instance"""
         return UserService(mock_bitsacco_api)
 
-    @pytest.mark.asyncio
     async def test_create_session(self, user_service):
         """Test session creation"""
         session = await user_service.get_or_create_session("+254700000000")
@@ -42,7 +123,6 @@ class TestUserService:
         assert session.current_state == UserState.INITIAL
         assert not session.is_authenticated
 
-    @pytest.mark.asyncio
     async def test_start_authentication_success(self, user_service):
         """Test successful authentication start"""
         success, message = await user_service.start_authentication(
@@ -52,7 +132,6 @@ class TestUserService:
         assert success is True
         assert "Verification Code Sent" in message
 
-    @pytest.mark.asyncio
     async def test_verify_otp_success(self, user_service):
         """Test successful OTP verification"""
         # Start authentication first
@@ -66,33 +145,156 @@ class TestUserService:
         assert success is True
         assert "Verification Successful" in message
 
-    @pytest.mark.asyncio
-    async def test_phone_number_cleaning(self, user_service):
-        """Test phone number normalization"""
-        test_numbers = [
+    async def test_least_recent_session_evicted(self, user_service):
+        """Test the session store is bounded by recency"""
+        user_service.max_sessions = 2
+
+        await user_service.get_or_create_session("+254700000001")
+        await user_service.get_or_create_session("+254700000002")
+        await user_service.get_or_create_session("+254700000001")
+        await user_service.get_or_create_session("+254700000003")
+
+        assert list(user_service.user_sessions) == [
+            "+254700000001",
+            "+254700000003",
+        ]
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
             ("0700000000", "+254700000000"),
             ("254700000000", "+254700000000"),
             ("+254700000000", "+254700000000"),
             ("700000000", "+254700000000"),
-        ]
+            ("+254 700-000 000", "+254700000000"),
+        ],
+        ids=["local", "country-code", "e164", "subscriber", "punctuated"],
+    )
+    def test_phone_number_cleaning(self, raw, expected):
+        """Test phone number normalization"""
+        assert normalize_phone_number(raw) == expected
+
+
+class TestBitsaccoAPIClient:
+    """Test Bitsacco API client request handling"""
 
-        for input_num, expected in test_numbers:
-            cleaned = user_service._clean_phone_number(input_num)
-            assert cleaned == expected
+    @staticmethod
+    def make_client(handler):
+        """API client whose requests are answered by handler"""
+        api = BitsaccoAPIClient()
+        api.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return api
+
+    async def test_transaction_history(self):
+        """Test a JSON response is parsed"""
+        api = self.make_client(
+            lambda request: httpx.Response(
+                200, json={"transactions": [{"id": "tx1"}], "total": 1}
+            )
+        )
+
+        result = await api.get_transaction_history("user_123")
+
+        assert result["success"] is True
+        assert result["transactions"] == [{"id": "tx1"}]
+
+    async def test_oversized_response_rejected(self):
+        """Test responses beyond max_response_bytes are refused"""
+        api = self.make_client(
+            lambda request: httpx.Response(200, content=b"x" * 2048)
+        )
+        api.max_response_bytes = 1024
+        limit = api.concurrency.limit
+
+        result = await api.get_transaction_history("user_123")
+
+        assert result["success"] is False
+        assert "limit" in result["message"]
+        # A body we refused is not upstream congestion
+        assert api.concurrency.limit == limit
+
+    async def test_oversized_streamed_response_rejected(self):
+        """Test a body without Content-Length is cut off while streaming"""
+
+        async def chunks():
+            for _ in range(4):
+                yield b"x" * 512
+
+        api = self.make_client(
+            lambda request: httpx.Response(200, content=chunks())
+        )
+        api.max_response_bytes = 1024
+
+        result = await api.get_transaction_history("user_123")
+
+        assert result["success"] is False
+        assert "limit" in result["message"]
+
+    @staticmethod
+    def make_sequence(*outcomes):
+        """Handler answering with outcomes in turn, plus its request log"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            outcome = outcomes[len(requests) - 1]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return httpx.Response(outcome, json={})
+
+        return handler, requests
+
+    @pytest.mark.parametrize(
+        "method, outcomes, calls",
+        [
+            ("GET", [503, 200], 2),
+            ("POST", [429, 201], 2),
+            ("POST", [httpx.ConnectError("refused"), 201], 2),
+        ],
+        ids=["get-503", "post-429", "post-connect-error"],
+    )
+    async def test_request_retried(self, method, outcomes, calls):
+        """Test transient failures are retried when a repeat is safe"""
+        handler, requests = self.make_sequence(*outcomes)
+        api = self.make_client(handler)
+        api.retry_delay = 0
+
+        assert await api._make_request(method, "/resource") == {}
+        assert len(requests) == calls
+
+    @pytest.mark.parametrize(
+        "method, outcome, expectation",
+        [
+            ("POST", 503, pytest.raises(httpx.HTTPStatusError)),
+            (
+                "POST",
+                httpx.ReadTimeout("slow"),
+                pytest.raises(httpx.ReadTimeout),
+            ),
+            ("GET", 501, pytest.raises(httpx.HTTPStatusError)),
+            ("POST", 202, nullcontext()),
+        ],
+        ids=["post-503", "post-read-timeout", "get-501", "post-202"],
+    )
+    async def test_request_not_retried(self, method, outcome, expectation):
+        """Test writes that may have been applied, and 501, are not retried"""
+        handler, requests = self.make_sequence(outcome, 200)
+        api = self.make_client(handler)
+        api.retry_delay = 0
+
+        with expectation:
+            await api._make_request(method, "/resource")
+        assert len(requests) == 1
 
 
 class TestAIService:
     """Test AI conversation service"""
 
     @pytest.fixture
-    def mock_openai_client(self):
+    def mock_openai_client(self, shared_openai_client):
         """Mock OpenAI client"""
-        mock = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Hello! How can I help you?"
-        mock.chat.completions.create.return_value = mock_response
-        return mock
+        shared_openai_client.reset_mock(side_effect=True)
+        return shared_openai_client
 
     @pytest.fixture
     def ai_service(self, mock_openai_client):
@@ -102,42 +304,31 @@ class TestAIService:
         service.is_running = True
         return service
 
-    @pytest.mark.asyncio
-    async def test_generate_response(self, ai_service):
+    async def test_generate_response(
+        self, ai_service, base_session, base_message
+    ):
         """Test AI response generation"""
-        user_session = UserSession(
-            user_id="test_user_id",
-            phone_number="+254700000000",
+        user_session = dataclasses.replace(
+            base_session,
             current_state=UserState.AUTHENTICATED,
             is_authenticated=True,
-            created_at=datetime.utcnow(),
-            last_activity=datetime.utcnow(),
-        )
-
-        message_context = MessageContext(
-            user_id="test_user_id",
-            original_message="Hello",
-            message_type=MessageType.TEXT,
-            timestamp=datetime.utcnow(),
         )
 
         response = await ai_service.generate_response(
-            user_session, message_context
+            user_session, base_message
         )
 
         assert response == "Hello! How can I help you?"
 
-    @pytest.mark.asyncio
-    async def test_welcome_message_authenticated(self, ai_service):
+    async def test_welcome_message_authenticated(
+        self, ai_service, base_session
+    ):
         """Test welcome message for authenticated user"""
-        user_session = UserSession(
-            user_id="test_user_id",
-            phone_number="+254700000000",
+        user_session = dataclasses.replace(
+            base_session,
             first_name="John",
             current_state=UserState.AUTHENTICATED,
             is_authenticated=True,
-            created_at=datetime.utcnow(),
-            last_activity=datetime.utcnow(),
         )
 
         message = await ai_service.generate_welcome_message(user_session)
@@ -145,19 +336,11 @@ class TestAIService:
         assert "Welcome back to Bitsacco" in message
         assert "John" in message
 
-    @pytest.mark.asyncio
-    async def test_welcome_message_unauthenticated(self, ai_service):
+    async def test_welcome_message_unauthenticated(
+        self, ai_service, base_session
+    ):
         """Test welcome message for unauthenticated user"""
-        user_session = UserSession(
-            user_id="test_user_id",
-            phone_number="+254700000000",
-            current_state=UserState.INITIAL,
-            is_authenticated=False,
-            created_at=datetime.utcnow(),
-            last_activity=datetime.utcnow(),
-        )
-
-        message = await ai_service.generate_welcome_message(user_session)
+        message = await ai_service.generate_welcome_message(base_session)
 
         assert "Welcome to Bitsacco" in message
         assert "Reply with 'start'" in message
@@ -167,28 +350,16 @@ class TestBitcoinService:
     """Test Bitcoin price service"""
 
     @pytest.fixture
-    def mock_http_client(self):
+    def mock_http_client(self, shared_http_client):
         """Mock HTTP client"""
-        mock = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "bitcoin": {
-                "usd": 45000.0,
-                "kes": 6750000.0,
-                "usd_24h_change": 2.5,
-                "kes_24h_change": 2.5,
-            }
-        }
-        mock_response.raise_for_status.return_value = None
-        mock.get.return_value = mock_response
-        return mock
+        shared_http_client.reset_mock(side_effect=True)
+        return shared_http_client
 
     @pytest.fixture
     def bitcoin_service(self):
         """Bitcoin service instance"""
         return SimpleBitcoinPriceService()
 
-    @pytest.mark.asyncio
     async def test_get_price_method_exists(self, bitcoin_service):
         """Test price fetching method exists"""
         # This would require mocking httpx for real tests
@@ -196,6 +367,62 @@ class TestBitcoinService:
         assert bitcoin_service.api_url is not None
         assert bitcoin_service.timeout == 10.0
 
+    async def test_get_current_price_cached(self, mock_http_client):
+        """Test repeated price lookups are served from the cache"""
+        service = SimpleBitcoinPriceService(client=mock_http_client)
+
+        assert await service.get_current_price("usd") == 45000.0
+        assert await service.get_current_price("usd") == 45000.0
+        assert mock_http_client.get.await_count == 1
+
+    async def test_concurrent_price_lookups_share_request(
+        self, mock_http_client
+    ):
+        """Test concurrent cache misses issue a single request"""
+        service = SimpleBitcoinPriceService(client=mock_http_client)
+
+        prices = await asyncio.gather(
+            *(service.get_current_price("usd") for _ in range(5))
+        )
+
+        assert prices == [45000.0] * 5
+        assert mock_http_client.get.await_count == 1
+
+    async def test_get_current_price_retries_transient_error(
+        self, mock_http_client
+    ):
+        """Test a transient upstream error is retried"""
+        unavailable = MagicMock(status_code=503, headers={})
+        mock_http_client.get.side_effect = [
+            unavailable,
+            mock_http_client.get.return_value,
+        ]
+        service = SimpleBitcoinPriceService(client=mock_http_client)
+        service.retry_delay = 0
+
+        assert await service.get_current_price("usd") == 45000.0
+        assert mock_http_client.get.await_count == 2
+
+    async def test_throttled_price_lookup_fails_fast(self, mock_http_client):
+        """Test a long Retry-After is not waited out inline"""
+        mock_http_client.get.side_effect = [
+            MagicMock(status_code=429, headers={"retry-after": "3"}),
+        ]
+        service = SimpleBitcoinPriceService(client=mock_http_client)
+
+        start = time.monotonic()
+        assert await service.get_current_price("usd") is None
+        assert time.monotonic() - start < 1.0
+        assert mock_http_client.get.await_count == 1
+
+    async def test_health_check_uses_cached_price(self, mock_http_client):
+        """Test health check reuses a fresh price instead of calling out"""
+        service = SimpleBitcoinPriceService(client=mock_http_client)
+
+        assert (await service.health_check())["status"] == "healthy"
+        assert (await service.health_check())["status"] == "healthy"
+        assert mock_http_client.get.await_count == 1
+
     def test_format_price(self, bitcoin_service):
         """Test price formatting"""
         formatted = bitcoin_service.format_price(45000.0, "USD")
@@ -203,3 +430,139 @@ class TestBitcoinService:
 
         formatted_none = bitcoin_service.format_price(None)
         assert "Price unavailable" in formatted_none
+
+
+class TestVoiceService:
+    """Test voice synthesis service"""
+
+    @pytest.fixture
+    def voice_service(self):
+        """Voice service instance with a mocked synthesizer"""
+        service = ElevenLabsVoiceService()
+        service.synthesize_speech = AsyncMock(
+            side_effect=lambda text, voice_id: f"{voice_id}:{text}".encode()
+        )
+        return service
+
+    async def test_synthesize_many_deduplicates(self, voice_service):
+        """Test identical requests share a single synthesis call"""
+        requests = [
+            {"text": "Hello"},
+            {"text": "Hello", "voice_id": "other"},
+            {"text": "Hello"},
+        ]
+
+        results = await voice_service.synthesize_many(requests)
+
+        default_voice = voice_service.voice_id
+        assert results == [
+            f"{default_voice}:Hello".encode(),
+            b"other:Hello",
+            f"{default_voice}:Hello".encode(),
+        ]
+        assert voice_service.synthesize_speech.await_count == 2
+
+    async def test_concurrent_identical_requests_share_call(self, monkeypatch):
+        """Test in-flight synthesis is reused by concurrent callers"""
+        calls = []
+
+        def fake_generate(text, voice, model):
+            calls.append(text)
+            time.sleep(0.05)
+            return b"audio"
+
+        monkeypatch.setattr(
+            voice_service_module, "generate", fake_generate, raising=False
+        )
+        service = ElevenLabsVoiceService()
+        service.is_running = True
+        service.is_initialized = True
+
+        results = await asyncio.gather(
+            service.synthesize_speech("Hello"),
+            service.synthesize_speech("Hello"),
+        )
+
+        assert results == [b"audio", b"audio"]
+        assert calls == ["Hello"]
+        assert not service._inflight
+
+
+class TestRateLimiter:
+    """Test outbound rate limiter"""
+
+    async def test_window_limit(self):
+        """Test requests beyond the limit wait for the window to slide"""
+        limiter = RateLimiter(rpm_limit=2, window=0.1)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.wait_if_throttled()
+
+        assert time.monotonic() - start >= 0.1
+
+    async def test_retry_after_header(self):
+        """Test Retry-After pauses the next request"""
+        limiter = RateLimiter(rpm_limit=100)
+        limiter.update_from_headers({"retry-after": "0.1"})
+
+        start = time.monotonic()
+        await limiter.wait_if_throttled()
+
+        assert time.monotonic() - start >= 0.1
+
+    def test_retry_after_capped_at_window(self):
+        """Test an oversized Retry-After pauses for at most one window"""
+        limiter = RateLimiter(rpm_limit=100, window=60.0)
+        limiter.update_from_headers({"retry-after": "86400"})
+
+        assert 59.0 < limiter.blocked_for() <= 60.0
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AIMD concurrency limiter"""
+
+    async def test_limit_adapts_to_outcomes(self):
+        """Test the limit halves on failure and grows while healthy"""
+        limiter = AdaptiveConcurrencyLimiter(initial=8, increase_every=2)
+
+        async with limiter.slot() as outcome:
+            outcome.healthy = False
+        assert limiter.limit == 4
+
+        for _ in range(2):
+            async with limiter.slot():
+                pass
+        assert limiter.limit == 5
+
+    async def test_concurrent_failures_halve_once(self):
+        """Test a burst of failures counts as a single congestion event"""
+        limiter = AdaptiveConcurrencyLimiter(initial=10)
+        admitted = asyncio.Event()
+        in_flight = 0
+
+        async def failing_request():
+            nonlocal in_flight
+            async with limiter.slot() as outcome:
+                in_flight += 1
+                if in_flight == 8:
+                    admitted.set()
+                await admitted.wait()
+                outcome.healthy = False
+
+        await asyncio.gather(*(failing_request() for _ in range(8)))
+
+        assert limiter.limit == 5
+
+    async def test_latency_excludes_time_outside_timed_block(self):
+        """Test only the timed part of a request counts towards latency"""
+        limiter = AdaptiveConcurrencyLimiter(
+            initial=4, target_latency=0.05, increase_every=1
+        )
+
+        async with limiter.slot() as outcome:
+            await asyncio.sleep(0.1)  # Queued behind other upstreams
+            with outcome.timed():
+                pass
+
+        assert limiter.limit == 5